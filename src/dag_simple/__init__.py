@@ -8,6 +8,7 @@ cycle detection, and result caching. Supports both sync and async nodes.
 
 from __future__ import annotations
 
+from dag_simple.codegen import compile_driver
 from dag_simple.context import ExecutionContext
 from dag_simple.dag import DAG
 from dag_simple.exceptions import (
@@ -21,6 +22,8 @@ from dag_simple.execution import (
     run_async_in_process,
     run_sync,
     run_sync_in_process,
+    run_sync_memoized,
+    shutdown_default_executor,
 )
 from dag_simple.node import Node, input_node, node
 
@@ -35,8 +38,11 @@ __all__ = [
     "ValidationError",
     "MissingDependencyError",
     "ExecutionContext",
+    "compile_driver",
     "run_sync",
+    "run_sync_memoized",
     "run_async",
     "run_sync_in_process",
     "run_async_in_process",
+    "shutdown_default_executor",
 ]
@@ -6,7 +6,10 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dag_simple.node import Node
 
 
 @dataclass
@@ -16,7 +19,31 @@ class ExecutionContext:
     cache: dict[str, Any] = field(default_factory=lambda: dict[str, Any]())
     inputs: dict[str, Any] = field(default_factory=lambda: dict[str, Any]())
     enable_cache: bool = True
-    _cache_locks: dict[str, asyncio.Lock] = field(default_factory=lambda: dict[str, asyncio.Lock]())
+    _inflight: dict[str, asyncio.Future[Any]] = field(
+        default_factory=lambda: dict[str, asyncio.Future[Any]]()
+    )
+    _arg_sources: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = field(
+        default_factory=lambda: dict[str, tuple[tuple[str, ...], tuple[str, ...]]]()
+    )
+
+    def arg_sources(self, node: Node[Any]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """
+        Return (dep_params, input_params) for a node under this context.
+
+        The inputs are fixed for the life of a context, so the per-parameter
+        "inputs override dependency outputs" decision is made once per node
+        here rather than on every binding.
+        """
+        sources = self._arg_sources.get(node.name)
+        if sources is None:
+            inputs = self.inputs
+            plan = node._get_arg_plan()  # pyright: ignore[reportPrivateUsage]
+            dep_params = tuple(
+                param for param, from_dep in plan if from_dep and param not in inputs
+            )
+            input_params = tuple(param for param, _ in plan if param in inputs)
+            sources = self._arg_sources[node.name] = (dep_params, input_params)
+        return sources
 
     def get_cached(self, key: str) -> tuple[bool, Any]:
         """Return (found, value) tuple."""
@@ -28,9 +55,3 @@ class ExecutionContext:
         """Cache a value."""
         if self.enable_cache:
             self.cache[key] = value
-
-    def get_cache_lock(self, key: str) -> asyncio.Lock:
-        """Get or create a lock for a cache key."""
-        if key not in self._cache_locks:
-            self._cache_locks[key] = asyncio.Lock()
-        return self._cache_locks[key]
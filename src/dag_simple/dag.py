@@ -5,10 +5,13 @@ High-level DAG container and executor.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from typing import Any
 
-if TYPE_CHECKING:
-    from dag_simple.node import Node
+from dag_simple.codegen import compile_driver
+from dag_simple.execution import run_sync_memoized
+from dag_simple.node import Node
+from dag_simple.validation import validate_no_cycles
 
 
 class DAG:
@@ -25,10 +28,23 @@ class DAG:
     def __init__(self, name: str = "dag"):
         self.name = name
         self.nodes: dict[str, Node[Any]] = {}
+        self._execution_order: list[str] | None = None
+        self._order_generation: int = -1
+        self._memo: dict[bytes, Any] = {}
 
     def add_node(self, node: Node[Any]) -> None:
-        """Add a node to this DAG."""
+        """
+        Add a node to this DAG.
+
+        Cycles are rejected here, at build time, so executions never pay
+        for validation.
+
+        Raises:
+            CycleDetectedError: If the node's dependency graph contains a cycle
+        """
+        validate_no_cycles(node)
         self.nodes[node.name] = node
+        self._execution_order = None
 
     def add_nodes(self, *nodes: Node[Any]) -> None:
         """Add multiple nodes to this DAG."""
@@ -71,6 +87,46 @@ class DAG:
             target = self.get_node(target)
         return await target.run_async(**inputs)
 
+    def run_memoized(self, target: str | Node[Any], **inputs: Any) -> Any:
+        """
+        Execute a target node with memoization that persists across runs.
+
+        Nodes created with ``memoize=True`` reuse their stored result when
+        their dependencies' results and relevant inputs are unchanged since
+        a previous run; everything else executes normally. The memo lives on
+        this DAG instance.
+
+        Args:
+            target: Node name or Node object to execute
+            **inputs: Input values for the DAG
+
+        Returns:
+            Result of the target node execution
+        """
+        if isinstance(target, str):
+            target = self.get_node(target)
+        return run_sync_memoized(target, self._memo, **inputs)
+
+    def compile(self, target: str | Node[Any], *, use_numba: bool = False) -> Callable[..., Any]:
+        """
+        Compile a target node's DAG into a specialized driver function.
+
+        The driver calls the node functions in topological order through
+        generated code, skipping per-call caching and runtime type
+        validation, which makes it suitable for small numeric DAGs executed
+        many times. See :func:`dag_simple.codegen.compile_driver`.
+
+        Args:
+            target: Node name or Node object to compile
+            use_numba: Wrap node functions with numba.njit when available
+
+        Returns:
+            A callable taking the DAG inputs as keyword arguments
+        """
+        if isinstance(target, str):
+            target = self.get_node(target)
+        return compile_driver(target, use_numba=use_numba)
+
     def execute_all(self, **inputs: Any) -> dict[str, Any]:
         """
         Execute all leaf nodes (nodes with no dependents) in the DAG.
@@ -132,9 +188,16 @@ class DAG:
         """
         Get the topological execution order for all nodes in the DAG.
 
+        The order is computed once and cached; adding nodes or editing any
+        node's dependency list invalidates it.
+
         Returns:
             List of node names in execution order
         """
+        cached = self._execution_order
+        if cached is not None and self._order_generation == Node._graph_generation:  # pyright: ignore[reportPrivateUsage]
+            return cached
+
         # Use any leaf node to get the full topological sort
         has_dependents: set[str] = set[str]()
         for node in self.nodes.values():
@@ -143,8 +206,7 @@ class DAG:
 
         leaf_nodes = [node for node in self.nodes.values() if node.name not in has_dependents]
 
-        if not leaf_nodes:
-            return []
-
-        # Get topological sort from first leaf node
-        return leaf_nodes[0].topological_sort() if leaf_nodes else []
+        order = leaf_nodes[0].topological_sort() if leaf_nodes else []
+        self._execution_order = order
+        self._order_generation = Node._graph_generation  # pyright: ignore[reportPrivateUsage]
+        return order
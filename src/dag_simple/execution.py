@@ -5,12 +5,16 @@ Execution logic for DAG nodes (sync and async).
 from __future__ import annotations
 
 import asyncio
-import inspect
+import hashlib
+import os
+import sys
+from collections import defaultdict, deque
+from collections.abc import Awaitable
 from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from dag_simple.context import ExecutionContext
-from dag_simple.exceptions import MissingDependencyError
+from dag_simple.exceptions import CycleDetectedError
 from dag_simple.validation import validate_input_types, validate_output_type
 
 if TYPE_CHECKING:
@@ -18,30 +22,175 @@ if TYPE_CHECKING:
 
 R = TypeVar("R")
 
+# Sentinel for cache probes: a single dict.get avoids the (found, value)
+# tuple allocation of ExecutionContext.get_cached on the hot path
+_MISS: Any = object()
+
 
 def has_async_nodes(node: Node[Any]) -> bool:
     """
     Check if this node or any of its dependencies are async.
 
+    Uses an explicit stack rather than recursion, so deep dependency chains
+    neither hit the interpreter recursion limit nor pay a Python frame per
+    level. Short-circuits on the first async node found.
+
+    The result is memoized on the node (invalidated when the graph
+    structure changes), so repeated executions of the same DAG pay for the
+    walk only once.
+
     Args:
         node: The node to check
 
     Returns:
         True if the node or any dependency is async
     """
+    node._ensure_fresh_traversal_caches()  # pyright: ignore[reportPrivateUsage]
+    cached = node._contains_async  # pyright: ignore[reportPrivateUsage]
+    if cached is not None:
+        return cached
+
+    result = False
     visited: set[str] = set()
+    stack: list[Node[Any]] = [node]
 
-    def check(n: Node[Any]) -> bool:
+    while stack:
+        n = stack.pop()
         if n.name in visited:
-            return False
+            continue
         visited.add(n.name)
 
         if n.is_async:
-            return True
+            result = True
+            break
+
+        stack.extend(n.deps)
+
+    node._contains_async = result  # pyright: ignore[reportPrivateUsage]
+    return result
+
+
+def _toposort(node: Node[Any]) -> tuple[Node[Any], ...]:
+    """
+    Return all nodes reachable from ``node`` in topological order (deps first).
+
+    Uses an iterative Kahn's algorithm. The order is memoized on the root
+    node (invalidated when the graph structure changes) so repeated
+    executions of a built-once DAG skip the walk entirely.
+
+    Args:
+        node: The root node to sort from
+
+    Returns:
+        Tuple of nodes in execution order
+
+    Raises:
+        CycleDetectedError: If a cycle is detected
+    """
+    node._ensure_fresh_traversal_caches()  # pyright: ignore[reportPrivateUsage]
+    cached = node._topo_order  # pyright: ignore[reportPrivateUsage]
+    if cached is not None:
+        return cached
+
+    nodes: dict[str, Node[Any]] = {}
+    dependents: dict[str, list[str]] = defaultdict(list)
+    in_degree: dict[str, int] = {}
+    stack: list[Node[Any]] = [node]
+
+    while stack:
+        n = stack.pop()
+        if n.name in nodes:
+            continue
+        nodes[n.name] = n
+        in_degree[n.name] = len(n.deps)
+        for dep in n.deps:
+            dependents[dep.name].append(n.name)
+            stack.append(dep)
+
+    queue = deque(name for name, degree in in_degree.items() if degree == 0)
+    order: list[Node[Any]] = []
+
+    while queue:
+        current = queue.popleft()
+        order.append(nodes[current])
+        for dependent in dependents[current]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    if len(order) != len(nodes):
+        raise CycleDetectedError("Cycle detected during topological sort")
+
+    # Record each producer's last consumer in execution order, so the
+    # executor can evict intermediate results as soon as nothing later
+    # will read them
+    last_use: dict[str, str] = {}
+    for n in order:
+        for dep in n.deps:
+            last_use[dep.name] = n.name
+
+    # A single topological pass runs every node exactly once, which only
+    # matches the recursive semantics when each shared result is meant to
+    # be reused: trivially true when nothing is shared, and true under
+    # caching when every shared node is cache_result
+    shared = [n for n in order if len(dependents[n.name]) > 1]
+    topo_unshared = not shared
+    topo_safe = all(n.cache_result for n in shared)
+
+    result = tuple(order)
+    node._topo_order = result  # pyright: ignore[reportPrivateUsage]
+    node._topo_safe = topo_safe  # pyright: ignore[reportPrivateUsage]
+    node._topo_unshared = topo_unshared  # pyright: ignore[reportPrivateUsage]
+    node._last_use = last_use  # pyright: ignore[reportPrivateUsage]
+    return result
+
+
+def _call_sync(node: Node[R], dep_values: dict[str, Any], _context: ExecutionContext) -> R:
+    """Bind dependency results and context inputs to a sync node, validate, and call it."""
+    accepted = node._get_binder()(dep_values, _context)  # pyright: ignore[reportPrivateUsage]
+
+    # Validate input types
+    if node._needs_input_validation:  # pyright: ignore[reportPrivateUsage]
+        validate_input_types(node, accepted, node.type_hints)
+
+    # Execute the function
+    try:
+        result: R = node.fn(**accepted)  # type: ignore[return-value]
+    except TypeError as e:
+        raise TypeError(
+            f"Failed running node '{node.name}' with args {node._param_names_list}: {e}"  # pyright: ignore[reportPrivateUsage]
+        ) from e
+
+    # Validate output type
+    if node._needs_output_validation:  # pyright: ignore[reportPrivateUsage]
+        validate_output_type(node, result, node.type_hints)
+
+    return result
+
 
-        return any(check(dep) for dep in n.deps)
+def _run_sync_recursive(node: Node[R], _context: ExecutionContext) -> R:
+    """
+    Execute a node recursively with per-consumer semantics.
 
-    return check(node)
+    Only nodes marked cache_result reuse their result (and only while
+    caching is enabled); any other shared dependency re-executes once per
+    consumer, matching run_async. Used whenever a single topological pass
+    would collapse those re-executions.
+    """
+    use_cache = _context.enable_cache and node.cache_result
+    if use_cache:
+        cached = _context.cache.get(node.name, _MISS)
+        if cached is not _MISS:
+            return cast(R, cached)
+
+    dep_values: dict[str, Any] = {}
+    for dep in node.deps:
+        dep_values[dep.name] = _run_sync_recursive(dep, _context)
+
+    result = _call_sync(node, dep_values, _context)
+    if use_cache:
+        _context.cache[node.name] = result
+    return result
 
 
 def run_sync(
@@ -52,14 +201,22 @@ def run_sync(
     **inputs: Any,
 ) -> R:
     """
-    Execute dependencies recursively and run this node (synchronous).
+    Execute dependencies and run this node (synchronous).
+
+    Graphs without shared dependencies — and, while caching is enabled,
+    graphs whose shared dependencies are all cache_result — are executed
+    iteratively in precomputed topological order, with dependency results
+    read back from the execution context, so deep DAGs pay neither Python
+    recursion frames nor repeated graph walks. Anything else falls back to
+    recursion so shared dependencies that should not be reused run once
+    per consumer, matching run_async.
 
     For async nodes, this will raise an error. Use run_async() instead.
 
     Args:
         node: The node to execute
         enable_cache: Enable result caching across the execution
-        _context: Internal execution context (for recursive calls)
+        _context: Internal execution context (advanced use)
         **inputs: Input values for the DAG
 
     Returns:
@@ -79,56 +236,213 @@ def run_sync(
     if _context is None:
         _context = ExecutionContext(enable_cache=enable_cache, inputs=inputs)
 
-    # Check cache
-    if node.cache_result:
-        found, cached_value = _context.get_cached(node.name)
-        if found:
-            return cached_value  # type: ignore
+    order = _toposort(node)
+    use_cache = _context.enable_cache
 
-    # Resolve inputs from dependencies
-    resolved: dict[str, Any] = {}
+    # With caching off, a shared dependency re-executes once per path, so
+    # only unshared graphs can take the single pass; with caching on, a
+    # shared dependency without cache_result still re-executes once per
+    # consumer, which a single pass over the order cannot express
+    single_pass = (
+        node._topo_safe if use_cache else node._topo_unshared  # pyright: ignore[reportPrivateUsage]
+    )
+    if not single_pass:
+        return _run_sync_recursive(node, _context)
 
-    for dep in node.deps:
-        dep_result = run_sync(dep, enable_cache=enable_cache, _context=_context, **inputs)
-        resolved[dep.name] = dep_result
+    cache = _context.cache
+    last_use = node._last_use or {}  # pyright: ignore[reportPrivateUsage]
 
-    # Merge provided inputs (override dependency outputs if same name)
-    resolved.update(_context.inputs)
+    for n in order:
+        if not use_cache or n.name not in cache:
+            # Dependency results are read straight out of the cache by the
+            # node's arg plan; no per-node resolved dict is built
+            cache[n.name] = _call_sync(n, cache, _context)
 
-    # Filter down to only args accepted by this node
-    accepted = {k: v for k, v in resolved.items() if k in node.sig.parameters}
+        # Evict dependency results once their last consumer has run, so
+        # peak memory tracks the live frontier rather than the whole DAG.
+        # Nodes marked cache_result keep their entries while caching is on.
+        for dep in n.deps:
+            if (not use_cache or not dep.cache_result) and last_use.get(dep.name) == n.name:
+                cache.pop(dep.name, None)
 
-    # Check for missing required parameters
-    required_params = {
-        name
-        for name, param in node.sig.parameters.items()
-        if param.default is inspect.Parameter.empty
-    }
-    missing = required_params - accepted.keys()
-    if missing:
-        raise MissingDependencyError(f"Node '{node.name}' missing required parameters: {missing}")
+    return cast(R, cache[node.name])
 
-    # Validate input types
-    validate_input_types(node, accepted, node.type_hints)
 
-    # Execute the function
-    try:
-        result: R = node.fn(**accepted)  # type: ignore[return-value]
-    except TypeError as e:
-        raise TypeError(
-            f"Failed running node '{node.name}' with args {list(accepted.keys())}: {e}"
-        ) from e
+# Input types whose repr round-trips their full value, making it safe
+# memoization-key material
+_REPR_FAITHFUL_TYPES = (type(None), bool, int, float, complex, str, bytes)
 
-    # Validate output type
-    validate_output_type(node, result, node.type_hints)
 
-    # Cache result if enabled
-    if node.cache_result:
-        _context.set_cached(node.name, result)
+def _content_token(value: Any) -> bytes:
+    """
+    Serialize an input value into stable bytes for a memoization key.
 
+    Only builtin scalars, and lists/tuples/sets/dicts of them, are
+    supported: their serialization encodes their full value. Anything else
+    — notably objects whose default repr only shows an address — is
+    rejected rather than risking a key that never matches or, worse,
+    silently collides across different values.
+
+    Args:
+        value: The input value to serialize
+
+    Returns:
+        A byte string that changes exactly when the value does
+
+    Raises:
+        TypeError: If the value (or a nested element) is unsupported
+    """
+    if isinstance(value, _REPR_FAITHFUL_TYPES):
+        return f"{type(value).__name__}:{value!r}".encode()
+    if isinstance(value, (list, tuple)):
+        items = b",".join(_content_token(item) for item in value)
+        return type(value).__name__.encode() + b"(" + items + b")"
+    if isinstance(value, (set, frozenset)):
+        items = b",".join(sorted(_content_token(item) for item in value))
+        return type(value).__name__.encode() + b"(" + items + b")"
+    if isinstance(value, dict):
+        entries = sorted(
+            _content_token(key) + b"=" + _content_token(item) for key, item in value.items()
+        )
+        return b"dict(" + b",".join(entries) + b")"
+    raise TypeError(
+        f"run_memoized does not support inputs of type '{type(value).__name__}': "
+        "memoization keys require values whose content can be serialized"
+    )
+
+
+def _memo_key(
+    node: Node[Any],
+    dep_values: dict[str, Any],
+    digests: dict[str, bytes],
+    inputs: dict[str, Any],
+) -> bytes:
+    """
+    Build a node's memoization key from its name, dep results, and inputs.
+
+    Dependency results are hashed by content, so an impure upstream node
+    that returns different data invalidates the key even though the graph
+    is unchanged. Results without a stable serialization fall back to the
+    dependency's own key, which assumes everything above it is pure.
+    """
+    key = hashlib.blake2b(node.name.encode())
+    for dep in node.deps:
+        try:
+            key.update(_content_token(dep_values[dep.name]))
+        except TypeError:
+            key.update(digests[dep.name])
+    for param, _ in node._get_arg_plan():  # pyright: ignore[reportPrivateUsage]
+        if param in inputs:
+            key.update(param.encode())
+            key.update(_content_token(inputs[param]))
+    return key.digest()
+
+
+def _run_memoized_recursive(
+    node: Node[R],
+    memo: dict[bytes, Any],
+    digests: dict[str, bytes],
+    _context: ExecutionContext,
+) -> R:
+    """
+    Execute a node recursively with memoization and per-consumer semantics.
+
+    Mirrors _run_sync_recursive: memoize and cache_result nodes reuse their
+    result within the run, while any other shared dependency re-executes
+    once per consumer. Used when a single topological pass would collapse
+    those re-executions (see run_sync_memoized).
+    """
+    cache = _context.cache
+    if node.memoize or node.cache_result:
+        cached = cache.get(node.name, _MISS)
+        if cached is not _MISS:
+            return cast(R, cached)
+
+    dep_values: dict[str, Any] = {}
+    for dep in node.deps:
+        dep_values[dep.name] = _run_memoized_recursive(dep, memo, digests, _context)
+
+    digest = _memo_key(node, dep_values, digests, _context.inputs)
+    digests[node.name] = digest
+
+    if node.memoize:
+        stored = memo.get(digest, _MISS)
+        if stored is not _MISS:
+            cache[node.name] = stored
+            return cast(R, stored)
+
+    result = _call_sync(node, dep_values, _context)
+    if node.memoize:
+        memo[digest] = result
+        cache[node.name] = result
+    elif node.cache_result:
+        cache[node.name] = result
     return result
 
 
+def run_sync_memoized(node: Node[R], memo: dict[bytes, Any], **inputs: Any) -> R:
+    """
+    Execute a node synchronously with memoization that persists across runs.
+
+    Each node gets a content key chaining its name, the serialized content
+    of its dependencies' results (see :func:`_memo_key` for the fallback
+    when a result has no stable serialization), and the serialized content
+    of the inputs it reads, so a key changes exactly when something
+    upstream of the node does. Nodes created with ``memoize=True`` skip
+    execution and reuse the result stored under their key from a previous
+    run; all other nodes execute normally — in particular, a shared
+    dependency without cache_result re-executes once per consumer, exactly
+    as under run_sync. Results are stored in ``memo``, which the caller
+    keeps alive between runs (see ``DAG.run_memoized``).
+
+    Args:
+        node: The node to execute
+        memo: Persistent mapping of content keys to results
+        **inputs: Input values for the DAG
+
+    Returns:
+        The result of executing this node
+
+    Raises:
+        RuntimeError: If the DAG contains async nodes
+        TypeError: If an input read by a node cannot serve as key material
+            (see :func:`_content_token`)
+    """
+    if has_async_nodes(node):
+        raise RuntimeError(
+            f"Node '{node.name}' or its dependencies contain async functions. "
+            "Use run_async() instead."
+        )
+
+    context = ExecutionContext(enable_cache=True, inputs=inputs)
+    cache = context.cache
+    digests: dict[str, bytes] = {}
+
+    order = _toposort(node)
+    if not node._topo_safe:  # pyright: ignore[reportPrivateUsage]
+        # A shared dependency without cache_result re-executes once per
+        # consumer, which a single pass over the order cannot express
+        return _run_memoized_recursive(node, memo, digests, context)
+
+    for n in order:
+        # The context cache holds every dependency result at this point
+        digest = _memo_key(n, cache, digests, inputs)
+        digests[n.name] = digest
+
+        if n.memoize:
+            cached = memo.get(digest, _MISS)
+            if cached is not _MISS:
+                cache[n.name] = cached
+                continue
+
+        result = _call_sync(n, cache, context)
+        cache[n.name] = result
+        if n.memoize:
+            memo[digest] = result
+
+    return cast(R, cache[node.name])
+
+
 async def run_async(
     node: Node[R],
     *,
@@ -155,68 +469,140 @@ async def run_async(
     if _context is None:
         _context = ExecutionContext(enable_cache=enable_cache, inputs=inputs)
 
-    # Handle caching with proper synchronization
-    if node.cache_result:
-        found, cached_value = _context.get_cached(node.name)
-        if found:
-            return cached_value  # type: ignore
+    # Handle caching with single-execution guarantees
+    if node.cache_result and _context.enable_cache:
+        cache = _context.cache
+        cached_value = cache.get(node.name, _MISS)
+        if cached_value is not _MISS:
+            return cast(R, cached_value)
+
+        # If another caller is already executing this node (diamond
+        # dependencies), await its in-flight future instead of building a
+        # second coroutine chain and serializing on a lock. The shield keeps
+        # a cancelled waiter from cancelling the shared future out from
+        # under the owner and the other waiters.
+        inflight = _context._inflight  # pyright: ignore[reportPrivateUsage]
+        existing = inflight.get(node.name)
+        if existing is not None:
+            return cast(R, await asyncio.shield(existing))
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        inflight[node.name] = future
+        try:
+            dep_values = await _resolve_deps(node, _context, inputs)
+            result = await _call_async(node, dep_values, _context)
+        except BaseException as e:
+            inflight.pop(node.name, None)
+            # The future is only completed if nothing cancelled it first
+            if not future.done():
+                future.set_exception(e)
+                # Mark the exception as retrieved in case nobody else awaited
+                future.exception()
+            raise
+
+        cache[node.name] = result
+        inflight.pop(node.name, None)
+        if not future.done():
+            future.set_result(result)
+        return result
+    else:
+        # No caching, execute normally
+        dep_values = await _resolve_deps(node, _context, inputs)
+        return await _call_async(node, dep_values, _context)
 
-        # If not cached, acquire lock and check again (double-checked locking pattern)
-        async with _context.get_cache_lock(node.name):
-            found, cached_value = _context.get_cached(node.name)
-            if found:
-                return cached_value  # type: ignore
 
-            # Execute the node within the lock to ensure only one execution
-            result = await _execute_node_without_cache(node, _context, inputs)
+def _spawn_dep(awaitable: Awaitable[Any]) -> Awaitable[Any]:
+    """
+    Wrap a dependency awaitable for gathering.
 
-            # Cache the result
-            _context.set_cached(node.name, result)
-            return result
-    else:
-        # No caching, execute normally
-        result = await _execute_node_without_cache(node, _context, inputs)
-        return result
+    On Python 3.12+ coroutines become eagerly started tasks, so ones that
+    complete without blocking (e.g. sub-trees of cache hits) finish without
+    an event loop round-trip. Futures and, on older versions, coroutines are
+    passed through and asyncio.gather schedules them as usual.
+    """
+    if sys.version_info >= (3, 12) and asyncio.iscoroutine(awaitable):
+        return asyncio.Task(awaitable, eager_start=True)
+    return awaitable
 
 
-async def _execute_node_without_cache(
-    node: Node[R],
+def _awaitable_for(
+    node: Node[Any],
     _context: ExecutionContext,
     inputs: dict[str, Any],
-) -> R:
-    """Execute a node without checking cache (helper function)."""
-    # Resolve inputs from dependencies (run them concurrently if possible)
-    resolved: dict[str, Any] = {}
+) -> Awaitable[Any]:
+    """
+    Return an awaitable for a node's result without always building a coroutine.
+
+    run_async is an ``async def``, so merely calling it allocates a coroutine
+    frame even when the result is already cached. This sync shim short-circuits
+    cached nodes to a completed future and nodes already executing to a
+    shielded view of their in-flight future; only genuinely new work gets a
+    run_async coroutine.
+    """
+    if node.cache_result and _context.enable_cache:
+        value = _context.cache.get(node.name, _MISS)
+        if value is not _MISS:
+            future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            return future
+
+        inflight = _context._inflight.get(node.name)  # pyright: ignore[reportPrivateUsage]
+        if inflight is not None:
+            # Shielded so a cancelled consumer cannot cancel the shared
+            # future other consumers (and its owner) still rely on
+            return asyncio.shield(inflight)
+
+    return run_async(node, enable_cache=_context.enable_cache, _context=_context, **inputs)
+
+
+async def _resolve_deps(
+    node: Node[Any],
+    _context: ExecutionContext,
+    inputs: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Resolve a node's dependencies concurrently and return their results.
+
+    Dependencies whose results are already cached are read inline, without
+    allocating a coroutine or paying an event-loop round-trip; only the
+    remaining pending dependencies are gathered.
+    """
+    dep_values: dict[str, Any] = {}
 
     if node.deps:
-        # Run all dependencies concurrently
-        dep_tasks = [
-            run_async(dep, enable_cache=_context.enable_cache, _context=_context, **inputs)
-            for dep in node.deps
-        ]
-        dep_results = await asyncio.gather(*dep_tasks)
-
-        for dep, result in zip(node.deps, dep_results, strict=True):
-            resolved[dep.name] = result
-
-    # Merge provided inputs (override dependency outputs if same name)
-    resolved.update(_context.inputs)
-
-    # Filter down to only args accepted by this node
-    accepted = {k: v for k, v in resolved.items() if k in node.sig.parameters}
-
-    # Check for missing required parameters
-    required_params = {
-        name
-        for name, param in node.sig.parameters.items()
-        if param.default is inspect.Parameter.empty
-    }
-    missing = required_params - accepted.keys()
-    if missing:
-        raise MissingDependencyError(f"Node '{node.name}' missing required parameters: {missing}")
+        cache = _context.cache
+        use_cache = _context.enable_cache
+        pending: list[Node[Any]] = []
+
+        for dep in node.deps:
+            if use_cache and dep.cache_result and dep.name in cache:
+                dep_values[dep.name] = cache[dep.name]
+            else:
+                pending.append(dep)
+
+        if len(pending) == 1:
+            # Fast path: a single pending dependency is awaited directly,
+            # skipping the _GatheringFuture and scheduling machinery
+            dep = pending[0]
+            dep_values[dep.name] = await _awaitable_for(dep, _context, inputs)
+        elif pending:
+            # Run the remaining dependencies concurrently
+            dep_tasks = [_spawn_dep(_awaitable_for(dep, _context, inputs)) for dep in pending]
+            dep_results = await asyncio.gather(*dep_tasks)
+
+            for dep, result in zip(pending, dep_results, strict=True):
+                dep_values[dep.name] = result
+
+    return dep_values
+
+
+async def _call_async(node: Node[R], dep_values: dict[str, Any], _context: ExecutionContext) -> R:
+    """Bind dependency results and context inputs to a node, validate, and call it."""
+    accepted = node._get_binder()(dep_values, _context)  # pyright: ignore[reportPrivateUsage]
 
     # Validate input types
-    validate_input_types(node, accepted, node.type_hints)
+    if node._needs_input_validation:  # pyright: ignore[reportPrivateUsage]
+        validate_input_types(node, accepted, node.type_hints)
 
     # Execute the function (async or sync)
     try:
@@ -226,15 +612,43 @@ async def _execute_node_without_cache(
             result: R = node.fn(**accepted)  # type: ignore[return-value]
     except TypeError as e:
         raise TypeError(
-            f"Failed running node '{node.name}' with args {list(accepted.keys())}: {e}"
+            f"Failed running node '{node.name}' with args {node._param_names_list}: {e}"  # pyright: ignore[reportPrivateUsage]
         ) from e
 
     # Validate output type
-    validate_output_type(node, result, node.type_hints)
+    if node._needs_output_validation:  # pyright: ignore[reportPrivateUsage]
+        validate_output_type(node, result, node.type_hints)
 
     return cast(R, result)
 
 
+# Shared process pool for run_*_in_process calls without an explicit
+# executor. Created lazily and kept alive so repeated calls reuse warm
+# workers instead of paying fork/spawn and module re-import per call.
+_default_executor: ProcessPoolExecutor | None = None
+
+
+def _get_default_executor() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _default_executor
+
+
+def shutdown_default_executor() -> None:
+    """
+    Shut down the shared process pool used by ``run_sync_in_process`` and
+    ``run_async_in_process``.
+
+    A new pool is created lazily on the next call that needs one.
+    """
+    global _default_executor
+    if _default_executor is not None:
+        _default_executor.shutdown()
+        _default_executor = None
+
+
 def run_sync_in_process(
     node: Node[R],
     *,
@@ -248,7 +662,8 @@ def run_sync_in_process(
         node: The root node to execute.
         enable_cache: Whether to enable caching for this execution.
         executor: Optional ``ProcessPoolExecutor`` to submit the work to. When
-            omitted, a temporary single-worker executor is created for the call.
+            omitted, a shared pool with persistent workers is used, so repeated
+            calls do not pay process startup costs.
         **inputs: Additional keyword arguments passed as DAG inputs.
 
     Returns:
@@ -259,13 +674,10 @@ def run_sync_in_process(
             the worker process.
     """
 
-    if executor is not None:
-        future = executor.submit(_run_sync_entry_point, node, enable_cache, inputs)
-        return future.result()
-
-    with ProcessPoolExecutor(max_workers=1) as process_pool:
-        future = process_pool.submit(_run_sync_entry_point, node, enable_cache, inputs)
-        return future.result()
+    if executor is None:
+        executor = _get_default_executor()
+    future = executor.submit(_run_sync_entry_point, node, enable_cache, inputs)
+    return future.result()
 
 
 def run_async_in_process(
@@ -281,7 +693,8 @@ def run_async_in_process(
         node: The root node to execute.
         enable_cache: Whether to enable caching for this execution.
         executor: Optional ``ProcessPoolExecutor`` to submit the work to. When
-            omitted, a temporary single-worker executor is created for the call.
+            omitted, a shared pool with persistent workers is used, so repeated
+            calls do not pay process startup costs.
         **inputs: Additional keyword arguments passed as DAG inputs.
 
     Returns:
@@ -292,13 +705,10 @@ def run_async_in_process(
             the worker process.
     """
 
-    if executor is not None:
-        future = executor.submit(_run_async_entry_point, node, enable_cache, inputs)
-        return future.result()
-
-    with ProcessPoolExecutor(max_workers=1) as process_pool:
-        future = process_pool.submit(_run_async_entry_point, node, enable_cache, inputs)
-        return future.result()
+    if executor is None:
+        executor = _get_default_executor()
+    future = executor.submit(_run_async_entry_point, node, enable_cache, inputs)
+    return future.result()
 
 
 def _run_sync_entry_point(
@@ -17,7 +17,9 @@ def topological_sort(node: Node[Any]) -> list[str]:
     """
     Return a topological sort of nodes (leaf nodes first).
 
-    Uses Kahn's algorithm for topological sorting.
+    Uses Kahn's algorithm for topological sorting. The graph is collected
+    over an explicit stack, so deep dependency chains do not hit the
+    interpreter recursion limit.
 
     Args:
         node: The root node to start from
@@ -29,23 +31,23 @@ def topological_sort(node: Node[Any]) -> list[str]:
     graph: dict[str, list[str]] = defaultdict(list)
     in_degree: dict[str, int] = defaultdict(int)
     all_nodes: set[str] = set()
+    stack: list[Node[Any]] = [node]
 
-    def build_graph(n: Node[Any]) -> None:
+    while stack:
+        n = stack.pop()
         if n.name in all_nodes:
-            return
+            continue
         all_nodes.add(n.name)
 
         for dep in n.deps:
             graph[dep.name].append(n.name)
             in_degree[n.name] += 1
-            build_graph(dep)
+            stack.append(dep)
 
         # Ensure node is in in_degree dict even if it has no dependencies
         if n.name not in in_degree:
             in_degree[n.name] = 0
 
-    build_graph(node)
-
     # Kahn's algorithm
     queue = deque([n for n in all_nodes if in_degree[n] == 0])
     result: list[str] = []
@@ -76,15 +78,15 @@ def graph_dict(node: Node[Any]) -> dict[str, list[str]]:
         Dictionary mapping node names to their dependency names
     """
     graph: dict[str, list[str]] = {}
+    stack: list[Node[Any]] = [node]
 
-    def collect(n: Node[Any]) -> None:
+    while stack:
+        n = stack.pop()
         if n.name in graph:
-            return
+            continue
         graph[n.name] = [d.name for d in n.deps]
-        for d in n.deps:
-            collect(d)
+        stack.extend(n.deps)
 
-    collect(node)
     return graph
 
 
@@ -99,14 +101,14 @@ def get_all_dependencies(node: Node[Any]) -> set[str]:
         Set of all dependency node names
     """
     deps: set[str] = set()
+    stack: list[Node[Any]] = list(node.deps)
 
-    def collect(n: Node[Any]) -> None:
-        for dep in n.deps:
-            if dep.name not in deps:
-                deps.add(dep.name)
-                collect(dep)
+    while stack:
+        dep = stack.pop()
+        if dep.name not in deps:
+            deps.add(dep.name)
+            stack.extend(dep.deps)
 
-    collect(node)
     return deps
 
 
@@ -122,19 +124,27 @@ def visualize(node: Node[Any], indent: int = 0, visited: set[str] | None = None)
     if visited is None:
         visited = set()
 
-    marker = "✓" if node.name in visited else "○"
-    cache_marker = " [cached]" if node.cache_result else ""
-    async_marker = " [async]" if node.is_async else ""
+    stack: list[tuple[Node[Any], int]] = [(node, indent)]
+
+    while stack:
+        current, level = stack.pop()
+        marker = "✓" if current.name in visited else "○"
+        cache_marker = " [cached]" if current.cache_result else ""
+        async_marker = " [async]" if current.is_async else ""
 
-    if node.name in visited:
-        print("  " * indent + f"{marker} {node.name}{cache_marker}{async_marker} (already shown)")
-        return
+        if current.name in visited:
+            print(
+                "  " * level
+                + f"{marker} {current.name}{cache_marker}{async_marker} (already shown)"
+            )
+            continue
 
-    visited.add(node.name)
-    print("  " * indent + f"{marker} {node.name}{cache_marker}{async_marker}")
+        visited.add(current.name)
+        print("  " * level + f"{marker} {current.name}{cache_marker}{async_marker}")
 
-    for d in node.deps:
-        visualize(d, indent + 1, visited)
+        # Reversed so the first dependency is printed first
+        for d in reversed(current.deps):
+            stack.append((d, level + 1))
 
 
 def to_mermaid(node: Node[Any]) -> str:
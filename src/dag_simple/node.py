@@ -5,10 +5,11 @@ Core Node class and decorators for DAG Simple.
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable, Coroutine
-from typing import Any, Generic, ParamSpec, TypeVar, get_type_hints
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any, ClassVar, Generic, ParamSpec, SupportsIndex, TypeVar, get_type_hints
 
 from dag_simple.context import ExecutionContext
+from dag_simple.exceptions import MissingDependencyError
 from dag_simple.execution import run_async, run_sync
 from dag_simple.introspection import (
     get_all_dependencies,
@@ -24,6 +25,9 @@ T = TypeVar("T")
 R = TypeVar("R")
 P = ParamSpec("P")
 
+# Bound once: avoids the inspect.Parameter.empty attribute chain per parameter
+_EMPTY = inspect.Parameter.empty
+
 
 class Node(Generic[R]):
     """
@@ -33,6 +37,12 @@ class Node(Generic[R]):
     Generic parameter R represents the return type of this node.
     """
 
+    # Monotonic generation of the overall graph structure, advanced whenever
+    # any node's dependency list changes (reassignment or in-place edits).
+    # Cached traversal results are stamped with the generation they were
+    # computed under, so a change anywhere conservatively invalidates them all.
+    _graph_generation: ClassVar[int] = 0
+
     def __init__(
         self,
         fn: Callable[..., R] | Callable[..., Coroutine[Any, Any, R]],
@@ -40,6 +50,7 @@ class Node(Generic[R]):
         deps: list[Node[Any]] | None = None,
         validate_types: bool = True,
         cache_result: bool = False,
+        memoize: bool = False,
     ):
         """
         Initialize a DAG node.
@@ -50,18 +61,32 @@ class Node(Generic[R]):
             deps: List of dependency nodes
             validate_types: Whether to perform runtime type validation
             cache_result: Whether to cache the result of this node
+            memoize: Whether to reuse this node's result across runs when its
+                dependencies' results and relevant inputs are unchanged (see
+                DAG.run_memoized); only meaningful for pure functions
         """
         self.fn = fn
         self.name = name or fn.__name__
-        self.deps: list[Node[Any]] = deps or []
+        self.deps = deps or []
         self.validate_types = validate_types
         self.cache_result = cache_result
+        self.memoize = memoize
         self.is_async = inspect.iscoroutinefunction(fn)
 
         # Introspection
         self.sig = inspect.signature(fn)
         self.type_hints: dict[str, Any] = {}
 
+        # Precompute signature-derived metadata so execution never has to
+        # iterate sig.parameters on the hot path; defaults for parameters
+        # the binder leaves unbound are applied by the function call itself
+        parameters = self.sig.parameters
+        self.param_name_tuple: tuple[str, ...] = tuple(parameters)
+        self._param_names_list: list[str] = list(parameters)
+        self.required_params: frozenset[str] = frozenset(
+            param_name for param_name, param in parameters.items() if param.default is _EMPTY
+        )
+
         # Get type hints if validation is enabled
         if self.validate_types:
             try:
@@ -70,9 +95,122 @@ class Node(Generic[R]):
                 # If we can't get type hints, disable validation for this node
                 self.validate_types = False
 
+        # Precompute whether validation can do anything at all, so execution
+        # can skip the calls entirely for unannotated nodes
+        self._needs_input_validation = self.validate_types and bool(self.type_hints)
+        self._needs_output_validation = self.validate_types and "return" in self.type_hints
+
         # Validate no cycles at construction time
         validate_no_cycles(self)
 
+    @property
+    def deps(self) -> list[Node[Any]]:
+        """Dependency nodes of this node. In-place edits are tracked for invalidation."""
+        return self._deps
+
+    @deps.setter
+    def deps(self, deps: list[Node[Any]]) -> None:
+        self._deps = _DepsList(deps)
+        Node._graph_generation += 1
+        self._reset_traversal_caches()
+
+    def _reset_traversal_caches(self) -> None:
+        """Drop lazily built traversal results and restamp to the current generation."""
+        self._contains_async: bool | None = None
+        self._topo_order: tuple[Node[Any], ...] | None = None
+        self._topo_safe: bool | None = None
+        self._topo_unshared: bool | None = None
+        self._last_use: dict[str, str] | None = None
+        self._arg_plan: tuple[tuple[str, bool], ...] | None = None
+        self._binder: Callable[[dict[str, Any], ExecutionContext], dict[str, Any]] | None = None
+        self._cache_generation: int = Node._graph_generation
+
+    def _ensure_fresh_traversal_caches(self) -> None:
+        """
+        Drop cached traversal results if the graph changed since they were
+        computed.
+
+        The generation stamp is global, so an edit to any dependency list —
+        including one deep inside this node's graph, which this node cannot
+        observe directly — invalidates conservatively.
+        """
+        if self._cache_generation != Node._graph_generation:
+            self._reset_traversal_caches()
+
+    def _get_binder(self) -> Callable[[dict[str, Any], ExecutionContext], dict[str, Any]]:
+        """
+        Return the specialized argument binder for this node.
+
+        The binder is a closure over the node's required params and name, so
+        each execution binds arguments with local lookups only; the
+        per-parameter source split is memoized on the execution context.
+        Built lazily and invalidated when the graph structure changes.
+        """
+        self._ensure_fresh_traversal_caches()
+        binder = self._binder
+        if binder is not None:
+            return binder
+
+        node = self
+        required = self.required_params
+        name = self.name
+
+        def bind(dep_values: dict[str, Any], context: ExecutionContext) -> dict[str, Any]:
+            dep_params, input_params = context.arg_sources(node)
+            inputs = context.inputs
+
+            args = {param: dep_values[param] for param in dep_params}
+            for param in input_params:
+                args[param] = inputs[param]
+
+            missing = required - args.keys()
+            if missing:
+                raise MissingDependencyError(
+                    f"Node '{name}' missing required parameters: {missing}"
+                )
+
+            return args
+
+        self._binder = bind
+        return bind
+
+    def _get_arg_plan(self) -> tuple[tuple[str, bool], ...]:
+        """
+        Return (param, from_dep) pairs used to bind arguments at execution.
+
+        from_dep marks parameters whose name matches a dependency. Computed
+        lazily and invalidated when the graph structure changes.
+        """
+        self._ensure_fresh_traversal_caches()
+        plan = self._arg_plan
+        if plan is None:
+            dep_names = {d.name for d in self._deps}
+            plan = self._arg_plan = tuple(
+                (param, param in dep_names) for param in self.param_name_tuple
+            )
+        return plan
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Return picklable state for process-based execution.
+
+        The lazily built traversal caches include closures (the argument
+        binder), which cannot be pickled; they are dropped here and rebuilt
+        on demand after unpickling.
+        """
+        state = self.__dict__.copy()
+        for cache_field in (
+            "_contains_async",
+            "_topo_order",
+            "_topo_safe",
+            "_topo_unshared",
+            "_last_use",
+            "_arg_plan",
+            "_binder",
+        ):
+            state[cache_field] = None
+        return state
+
     def _validate_no_cycles(self) -> None:
         """Detect cycles in the DAG starting from this node."""
         validate_no_cycles(self)
@@ -156,12 +294,64 @@ class Node(Generic[R]):
         return f"<Node {self.name} deps={dep_names}{cache_str}{async_str}>"
 
 
+class _DepsList(list["Node[Any]"]):
+    """
+    Dependency list that tracks in-place mutation.
+
+    The graph can be edited without going through the ``deps`` setter
+    (``node.deps.append(...)``), so every mutating method advances the graph
+    generation that cached traversal results are stamped against.
+    """
+
+    def _mutated(self) -> None:
+        Node._graph_generation += 1  # pyright: ignore[reportPrivateUsage]
+
+    def append(self, item: Node[Any]) -> None:
+        super().append(item)
+        self._mutated()
+
+    def extend(self, items: Iterable[Node[Any]]) -> None:
+        super().extend(items)
+        self._mutated()
+
+    def insert(self, index: SupportsIndex, item: Node[Any]) -> None:
+        super().insert(index, item)
+        self._mutated()
+
+    def remove(self, item: Node[Any]) -> None:
+        super().remove(item)
+        self._mutated()
+
+    def pop(self, index: SupportsIndex = -1) -> Node[Any]:
+        item = super().pop(index)
+        self._mutated()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+
+    def __setitem__(self, index: SupportsIndex | slice, item: Any) -> None:
+        super().__setitem__(index, item)
+        self._mutated()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        super().__delitem__(index)
+        self._mutated()
+
+    def __iadd__(self, items: Iterable[Node[Any]]) -> _DepsList:
+        super().__iadd__(items)
+        self._mutated()
+        return self
+
+
 def node(
     *,
     deps: list[Node[Any]] | None = None,
     name: str | None = None,
     validate_types: bool = True,
     cache_result: bool = False,
+    memoize: bool = False,
 ) -> Callable[[Callable[P, R] | Callable[P, Coroutine[Any, Any, R]]], Node[R]]:
     """
     Decorator: declare a DAG node with optional dependencies.
@@ -173,6 +363,8 @@ def node(
         name: Optional name for the node
         validate_types: Enable runtime type validation
         cache_result: Enable result caching
+        memoize: Reuse results across runs when upstream results and inputs
+            are unchanged (see DAG.run_memoized)
 
     Example:
         # Sync node
@@ -194,6 +386,7 @@ def node(
             deps=deps,
             validate_types=validate_types,
             cache_result=cache_result,
+            memoize=memoize,
         )
 
     return wrapper
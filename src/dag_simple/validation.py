@@ -4,6 +4,7 @@ Validation utilities for DAG nodes.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, get_origin
 
 from dag_simple.exceptions import CycleDetectedError, ValidationError
@@ -16,6 +17,10 @@ def validate_no_cycles(node: Node[Any]) -> None:
     """
     Detect cycles in the DAG starting from this node.
 
+    Runs a depth-first search over an explicit stack rather than by
+    recursion, so deep dependency chains can be validated (and therefore
+    built) without hitting the interpreter recursion limit.
+
     Args:
         node: The node to check for cycles
 
@@ -23,25 +28,26 @@ def validate_no_cycles(node: Node[Any]) -> None:
         CycleDetectedError: If a cycle is detected
     """
     visited: set[str] = set()
-    path: set[str] = set()
-
-    def dfs(n: Node[Any]) -> None:
-        if n.name in path:
-            cycle = " -> ".join(list(path) + [n.name])
-            raise CycleDetectedError(f"Cycle detected: {cycle}")
-
-        if n.name in visited:
-            return
-
-        visited.add(n.name)
-        path.add(n.name)
-
-        for dep in n.deps:
-            dfs(dep)
-
-        path.remove(n.name)
-
-    dfs(node)
+    path: list[str] = [node.name]
+    on_path: set[str] = {node.name}
+    stack: list[tuple[Node[Any], Iterator[Node[Any]]]] = [(node, iter(node.deps))]
+
+    while stack:
+        current, deps = stack[-1]
+        for dep in deps:
+            if dep.name in on_path:
+                cycle = " -> ".join(path + [dep.name])
+                raise CycleDetectedError(f"Cycle detected: {cycle}")
+            if dep.name not in visited:
+                path.append(dep.name)
+                on_path.add(dep.name)
+                stack.append((dep, iter(dep.deps)))
+                break
+        else:
+            visited.add(current.name)
+            on_path.discard(current.name)
+            path.pop()
+            stack.pop()
 
 
 def validate_input_types(
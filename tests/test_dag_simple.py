@@ -1,6 +1,7 @@
 """Comprehensive test suite for dag-simple."""
 
 import asyncio
+from typing import Any
 
 import pytest
 
@@ -12,6 +13,18 @@ from dag_simple import (
     input_node,
     node,
 )
+from dag_simple.node import Node
+
+
+def _deep_chain(depth: int) -> Node[int]:
+    """Build a linear chain of ``depth`` increment nodes above an input node ``n0``."""
+    namespace: dict[str, Any] = {}
+    exec("def n0(x: int) -> int:\n    return x", namespace)
+    chain: Node[int] = Node(namespace["n0"], name="n0")
+    for i in range(depth):
+        exec(f"def step(n{i}: int) -> int:\n    return n{i} + 1", namespace)
+        chain = Node(namespace["step"], name=f"n{i + 1}", deps=[chain])
+    return chain
 
 
 class TestBasicNode:
@@ -139,6 +152,33 @@ class TestCaching:
         assert result == 53  # (25+1) + (25+2)
         assert call_count["count"] == 1  # Called only once
 
+    def test_uncached_shared_dependency_runs_per_consumer(self) -> None:
+        """Shared deps without cache_result re-execute for each consumer."""
+        call_count = {"count": 0}
+
+        @node()
+        def shared(x: int) -> int:
+            call_count["count"] += 1
+            return x * x
+
+        @node(deps=[shared])
+        def user1(shared: int) -> int:
+            return shared + 1
+
+        @node(deps=[shared])
+        def user2(shared: int) -> int:
+            return shared + 2
+
+        @node(deps=[user1, user2])
+        def combine(user1: int, user2: int) -> int:
+            return user1 + user2
+
+        result = combine.run(x=5)
+        assert result == 53
+        # cache_result is the opt-in for single execution; without it the
+        # shared node runs once per consumer, as in run_async
+        assert call_count["count"] == 2
+
     def test_cache_disabled(self) -> None:
         """Test execution without caching."""
         call_count = {"count": 0}
@@ -165,6 +205,11 @@ class TestCaching:
         # Without caching, expensive is called for each dependent
         assert call_count["count"] >= 2
 
+    def test_cache_disabled_deep_chain(self) -> None:
+        """Unshared graphs run iteratively even with caching disabled."""
+        deep = _deep_chain(1100)
+        assert deep.run(x=0, enable_cache=False) == 1100
+
 
 class TestCycleDetection:
     """Test cycle detection."""
@@ -217,6 +262,66 @@ class TestCycleDetection:
             a._validate_no_cycles()  # pyright: ignore[reportPrivateUsage]
 
 
+class TestDepsMutation:
+    """Test cache invalidation when dependency lists change after a run."""
+
+    def test_in_place_append_picked_up_by_rerun(self) -> None:
+        """Appending a dependency in place must invalidate cached traversals."""
+
+        @node()
+        def a(x: int) -> int:
+            return x + 1
+
+        @node()
+        def b(x: int) -> int:
+            return x * 10
+
+        @node(deps=[a])
+        def c(a: int, b: int = 0) -> int:
+            return a + b
+
+        assert c.run(x=1) == 2
+        c.deps.append(b)
+        assert c.run(x=1) == 12
+
+    def test_dependency_mutation_invalidates_ancestors(self) -> None:
+        """Editing a dependency's own deps must refresh ancestors' cached order."""
+
+        @node()
+        def leaf(x: int) -> int:
+            return x
+
+        @node()
+        def mid(x: int, leaf: int = 0) -> int:
+            return x + leaf
+
+        @node(deps=[mid])
+        def top(mid: int) -> int:
+            return mid * 2
+
+        assert top.run(x=3) == 6
+        mid.deps.append(leaf)
+        assert top.run(x=3) == 12
+
+    def test_async_flag_refreshed_after_mutation(self) -> None:
+        """Appending an async dependency must be seen by run()."""
+
+        @node()
+        async def async_dep() -> int:
+            await asyncio.sleep(0.01)
+            return 1
+
+        @node()
+        def sync_root(x: int, async_dep: int = 0) -> int:
+            return x + async_dep
+
+        assert sync_root.run(x=1) == 1
+        sync_root.deps.append(async_dep)
+
+        with pytest.raises(RuntimeError):
+            sync_root.run(x=1)
+
+
 class TestTopologicalSort:
     """Test topological sorting."""
 
@@ -501,6 +606,14 @@ class TestComplexScenarios:
         # 10 + (10+0 + 10+1 + 10+2 + 10+3 + 10+4)
         assert result == 60
 
+    def test_deep_chain_construction_and_traversal(self) -> None:
+        """Chains deeper than the recursion limit can be built and introspected."""
+        deep = _deep_chain(1100)
+
+        assert len(deep.get_all_dependencies()) == 1100
+        assert deep.topological_sort()[0] == "n0"
+        assert deep.run(x=0) == 1100
+
     def test_mixed_cached_uncached(self) -> None:
         """Test mixing cached and uncached nodes."""
 
@@ -761,17 +874,30 @@ class TestDAGClassEnhancements:
 class TestExecutionContext:
     """Test ExecutionContext utility behavior."""
 
-    def test_get_cache_lock_reuses_same_lock(self) -> None:
-        """Cache locks should be reused per key."""
+    def test_intermediate_results_evicted_after_last_use(self) -> None:
+        """Non-persistent intermediate results are evicted once consumed."""
         from dag_simple.context import ExecutionContext
+        from dag_simple.execution import run_sync
+
+        @node()
+        def step1(x: int) -> int:
+            return x + 1
+
+        @node(deps=[step1], cache_result=True)
+        def step2(step1: int) -> int:
+            return step1 + 1
+
+        @node(deps=[step2])
+        def step3(step2: int) -> int:
+            return step2 + 1
 
-        context = ExecutionContext(enable_cache=True)
-        first = context.get_cache_lock("key")
-        second = context.get_cache_lock("key")
-        other = context.get_cache_lock("other")
+        context = ExecutionContext(enable_cache=True, inputs={"x": 0})
+        result = run_sync(step3, _context=context, x=0)
 
-        assert first is second
-        assert first is not other
+        assert result == 3
+        # step1 was evicted after step2 consumed it; step2 is cache_result
+        assert "step1" not in context.cache
+        assert context.cache["step2"] == 2
 
 
 class TestExecutionErrorHandling:
@@ -846,6 +972,34 @@ class TestExecutionErrorHandling:
         assert result == 23  # (10+1) + (10+2)
         assert call_count["count"] == 1  # Called only once
 
+    def test_run_async_timeout_on_shared_dependency(self) -> None:
+        """A cancelled waiter must not corrupt the shared in-flight future."""
+
+        @node(cache_result=True)
+        async def slow(x: int) -> int:
+            await asyncio.sleep(1)
+            return x
+
+        @node(deps=[slow])
+        async def left(slow: int) -> int:
+            return slow + 1
+
+        @node(deps=[slow])
+        async def right(slow: int) -> int:
+            return slow + 2
+
+        @node(deps=[left, right])
+        async def bottom(left: int, right: int) -> int:
+            return left + right
+
+        async def run_test() -> None:
+            # Timing out cancels both consumers; the shared future must not
+            # end up cancelled-then-completed (InvalidStateError)
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(bottom.run_async(x=1), timeout=0.05)
+
+        asyncio.run(run_test())
+
     def test_run_async_early_cached_return(self) -> None:
         """Test early cached return in run_async (missing coverage)."""
         call_count = {"count": 0}
@@ -1084,6 +1238,276 @@ class TestValidationEdgeCases:
         assert result == [5, 10]
 
 
+class TestMemoization:
+    """Test cross-run memoization via DAG.run_memoized."""
+
+    def test_memoized_node_reused_across_runs(self) -> None:
+        """Memoized nodes should not re-execute when inputs are unchanged."""
+        call_count = {"count": 0}
+        dag = DAG()
+
+        @node(memoize=True)
+        def expensive(x: int) -> int:
+            call_count["count"] += 1
+            return x * x
+
+        @node(deps=[expensive])
+        def consumer(expensive: int) -> int:
+            return expensive + 1
+
+        dag.add_nodes(expensive, consumer)
+
+        assert dag.run_memoized("consumer", x=5) == 26
+        assert dag.run_memoized("consumer", x=5) == 26
+        assert call_count["count"] == 1
+
+    def test_memoized_node_recomputed_on_input_change(self) -> None:
+        """Changing inputs should invalidate the memoized result."""
+        call_count = {"count": 0}
+        dag = DAG()
+
+        @node(memoize=True)
+        def expensive(x: int) -> int:
+            call_count["count"] += 1
+            return x * x
+
+        dag.add_node(expensive)
+
+        assert dag.run_memoized("expensive", x=2) == 4
+        assert dag.run_memoized("expensive", x=3) == 9
+        assert dag.run_memoized("expensive", x=2) == 4
+        assert call_count["count"] == 2
+
+    def test_non_memoized_nodes_rerun(self) -> None:
+        """Nodes without memoize=True should execute every run."""
+        call_count = {"count": 0}
+        dag = DAG()
+
+        @node()
+        def plain(x: int) -> int:
+            call_count["count"] += 1
+            return x + 1
+
+        dag.add_node(plain)
+
+        dag.run_memoized("plain", x=1)
+        dag.run_memoized("plain", x=1)
+        assert call_count["count"] == 2
+
+    def test_uncached_shared_dependency_runs_per_consumer(self) -> None:
+        """run_memoized keeps run_sync's per-consumer semantics for shared deps."""
+        call_count = {"count": 0}
+        dag = DAG()
+
+        @node()
+        def shared(x: int) -> int:
+            call_count["count"] += 1
+            return x * x
+
+        @node(deps=[shared])
+        def user1(shared: int) -> int:
+            return shared + 1
+
+        @node(deps=[shared])
+        def user2(shared: int) -> int:
+            return shared + 2
+
+        @node(deps=[user1, user2], memoize=True)
+        def combine(user1: int, user2: int) -> int:
+            return user1 + user2
+
+        dag.add_nodes(shared, user1, user2, combine)
+
+        assert dag.run_memoized("combine", x=5) == 53
+        assert call_count["count"] == 2
+
+    def test_memo_keys_distinguish_container_contents(self) -> None:
+        """Container inputs should key on their contents, not their repr identity."""
+        call_count = {"count": 0}
+        dag = DAG()
+
+        @node(memoize=True)
+        def total(values: list[int]) -> int:
+            call_count["count"] += 1
+            return sum(values)
+
+        dag.add_node(total)
+
+        assert dag.run_memoized("total", values=[1, 2]) == 3
+        assert dag.run_memoized("total", values=[1, 3]) == 4
+        assert dag.run_memoized("total", values=[1, 2]) == 3
+        assert call_count["count"] == 2
+
+    def test_memoized_node_sees_changed_upstream_results(self) -> None:
+        """A memoized node must recompute when an impure dep returns new data."""
+        state = {"value": 1}
+        call_count = {"count": 0}
+        dag = DAG()
+
+        @node()
+        def source() -> int:
+            return state["value"]
+
+        @node(deps=[source], memoize=True)
+        def doubled(source: int) -> int:
+            call_count["count"] += 1
+            return source * 2
+
+        dag.add_nodes(source, doubled)
+
+        assert dag.run_memoized("doubled") == 2
+        state["value"] = 3
+        assert dag.run_memoized("doubled") == 6
+        assert call_count["count"] == 2
+
+    def test_memo_key_falls_back_for_unserializable_dep_results(self) -> None:
+        """Dep results without a stable serialization key on the dep's own key."""
+        call_count = {"count": 0}
+        dag = DAG()
+
+        class Payload:
+            def __init__(self, value: int):
+                self.value = value
+
+        @node(validate_types=False)
+        def make_payload(x: int) -> Payload:
+            return Payload(x)
+
+        @node(deps=[make_payload], memoize=True, validate_types=False)
+        def unwrap(make_payload: Payload) -> int:
+            call_count["count"] += 1
+            return make_payload.value
+
+        dag.add_nodes(make_payload, unwrap)
+
+        assert dag.run_memoized("unwrap", x=7) == 7
+        assert dag.run_memoized("unwrap", x=7) == 7
+        assert call_count["count"] == 1
+
+    def test_run_memoized_rejects_unsupported_inputs(self) -> None:
+        """Inputs whose content cannot be serialized are rejected, not mis-keyed."""
+
+        class Opaque:
+            pass
+
+        dag = DAG()
+
+        @node(memoize=True, validate_types=False)
+        def identity(x: object) -> object:
+            return x
+
+        dag.add_node(identity)
+
+        with pytest.raises(TypeError, match="does not support inputs"):
+            dag.run_memoized("identity", x=Opaque())
+
+    def test_run_memoized_rejects_async(self) -> None:
+        """run_memoized should reject async DAGs like run()."""
+        dag = DAG()
+
+        @node()
+        async def async_func(x: int) -> int:
+            await asyncio.sleep(0.01)
+            return x
+
+        dag.add_node(async_func)
+
+        with pytest.raises(RuntimeError):
+            dag.run_memoized("async_func", x=1)
+
+
+class TestCompiledDriver:
+    """Test DAG compilation into specialized drivers."""
+
+    def test_compile_matches_run(self) -> None:
+        """Compiled drivers should produce the same results as run()."""
+        dag = DAG(name="test")
+
+        @node()
+        def root(x: int) -> int:
+            return x
+
+        @node(deps=[root])
+        def left(root: int) -> int:
+            return root + 1
+
+        @node(deps=[root])
+        def right(root: int) -> int:
+            return root + 2
+
+        @node(deps=[left, right])
+        def bottom(left: int, right: int) -> int:
+            return left + right
+
+        dag.add_nodes(root, left, right, bottom)
+        driver = dag.compile("bottom")
+
+        assert driver(x=10) == bottom.run(x=10)
+
+    def test_compile_inputs_override_deps(self) -> None:
+        """Inputs should override same-named dependency outputs."""
+        dag = DAG()
+
+        @node()
+        def base(x: int) -> int:
+            return x * 2
+
+        @node(deps=[base])
+        def derived(base: int) -> int:
+            return base + 10
+
+        dag.add_nodes(base, derived)
+        driver = dag.compile(derived)
+
+        assert driver(x=5) == 20
+        assert driver(x=5, base=100) == 110
+
+    def test_compile_missing_input(self) -> None:
+        """Compiled drivers should report missing required inputs."""
+        dag = DAG()
+
+        @node()
+        def needs_x(x: int) -> int:
+            return x
+
+        dag.add_node(needs_x)
+        driver = dag.compile("needs_x")
+
+        with pytest.raises(MissingDependencyError) as exc_info:
+            driver()
+
+        assert "missing required inputs" in str(exc_info.value)
+
+    def test_compile_rejects_async(self) -> None:
+        """Async DAGs cannot be compiled."""
+        dag = DAG()
+
+        @node()
+        async def async_func(x: int) -> int:
+            await asyncio.sleep(0.01)
+            return x
+
+        dag.add_node(async_func)
+
+        with pytest.raises(RuntimeError) as exc_info:
+            dag.compile("async_func")
+
+        assert "cannot be compiled" in str(exc_info.value)
+
+    def test_compile_numba_falls_back(self) -> None:
+        """use_numba should fall back to Python when numba is unavailable."""
+        dag = DAG()
+
+        @node()
+        def double(x: int) -> int:
+            return x * 2
+
+        dag.add_node(double)
+        driver = dag.compile("double", use_numba=True)
+
+        assert driver(x=3) == 6
+
+
 class TestDAGVisualization:
     """Test DAG visualization methods."""
 
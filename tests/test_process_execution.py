@@ -4,7 +4,12 @@ from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 
-from dag_simple.execution import run_async_in_process, run_sync_in_process
+from dag_simple.execution import (
+    _get_default_executor,  # pyright: ignore[reportPrivateUsage]
+    run_async_in_process,
+    run_sync_in_process,
+    shutdown_default_executor,
+)
 
 from .process_nodes import add_async, double, explode, explode_async
 
@@ -19,6 +24,13 @@ def test_run_async_in_process_returns_value() -> None:
     assert result == 5
 
 
+def test_run_sync_in_process_after_local_run() -> None:
+    # A local run builds the node's unpicklable binder closure; pickling for
+    # the worker process must still succeed afterwards.
+    assert double.run() == 4
+    assert run_sync_in_process(double) == 4
+
+
 def test_run_sync_in_process_with_custom_executor() -> None:
     with ProcessPoolExecutor(max_workers=1) as executor:
         result_one = run_sync_in_process(double, executor=executor)
@@ -37,6 +49,22 @@ def test_run_async_in_process_with_custom_executor() -> None:
     assert result_two == 5
 
 
+def test_default_executor_is_reused() -> None:
+    first = _get_default_executor()
+    second = _get_default_executor()
+
+    assert first is second
+
+
+def test_shutdown_default_executor_resets_pool() -> None:
+    first = _get_default_executor()
+    shutdown_default_executor()
+    second = _get_default_executor()
+
+    assert first is not second
+    assert run_sync_in_process(double) == 4
+
+
 def test_run_sync_in_process_propagates_exceptions() -> None:
     with pytest.raises(ValueError, match="boom"):
         run_sync_in_process(explode)